@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional
 from uuid import UUID
 from pathlib import Path
@@ -7,8 +8,9 @@ from pathlib import Path
 from pydantic import BaseModel, EmailStr, Field
 
 
+@lru_cache(maxsize=None)
 def to_camel(snake_str: str) -> str:
-    """Convert snake_case to camelCase"""
+    """Convert snake_case to camelCase (cached, field names repeat across models)"""
     components = snake_str.split("_")
     return components[0] + "".join(x.title() for x in components[1:])
 
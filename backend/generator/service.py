@@ -2,6 +2,7 @@
 """Simplified project generator for Syft LLM Router with two paths: default and custom."""
 
 import argparse
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -12,6 +13,14 @@ from syft_core import Client as SyftClient
 
 RouterType = Literal["default", "custom"]
 
+# Files from the common directory shared by every router type
+COMMON_FILES: tuple[str, ...] = (
+    "base_services.py",
+    "schema.py",
+    "server.py",
+    "config.py",
+)
+
 
 class UserAccountingConfig(BaseModel):
     """User accounting configuration."""
@@ -75,15 +84,22 @@ class SimplifiedProjectGenerator:
 
     def _copy_common_files(self, output_path: Path) -> None:
         """Copy common files that are shared between all router types."""
-        common_files = ["base_services.py", "schema.py", "server.py", "config.py"]
-
-        for file_name in common_files:
-            source = self.common_dir / file_name
-            if source.exists():
+        # Index the common directory once instead of stat-ing each file
+        try:
+            with os.scandir(self.common_dir) as entries:
+                available = {
+                    entry.name: entry.path for entry in entries if entry.is_file()
+                }
+        except FileNotFoundError:
+            available = {}
+
+        for file_name in COMMON_FILES:
+            source = available.get(file_name)
+            if source is not None:
                 shutil.copy2(source, output_path / file_name)
                 print(f"✅ Copied {file_name}")
             else:
-                print(f"⚠️  Common file not found: {source}")
+                print(f"⚠️  Common file not found: {self.common_dir / file_name}")
 
     def _copy_template_files(
         self, output_path: Path, template_path: Path, config: ProjectConfig
@@ -211,8 +227,7 @@ class SyftLLMRouter:
         )
 '''
 
-        with open(output_path / "router.py", "w") as f:
-            f.write(router_content)
+        (output_path / "router.py").write_bytes(router_content.encode("utf-8"))
 
     def _generate_requirements(self, output_path: Path, config: ProjectConfig) -> None:
         """Generate pyproject.toml with optional dependency groups."""
@@ -266,8 +281,9 @@ python_classes = ["Test*"]
 python_functions = ["test_*"]
 """
 
-        with open(output_path / "pyproject.toml", "w") as f:
-            f.write(pyproject_content)
+        (output_path / "pyproject.toml").write_bytes(
+            pyproject_content.encode("utf-8")
+        )
 
     def _generate_env_example(self, output_path: Path, config: ProjectConfig) -> None:
         """Generate .env.example file."""
@@ -309,8 +325,8 @@ python_functions = ["test_*"]
                 ]
             )
 
-        with open(output_path / ".env.example", "w") as f:
-            f.write("\n".join(env_vars) + "\n")
+        env_content = "\n".join(env_vars) + "\n"
+        (output_path / ".env.example").write_bytes(env_content.encode("utf-8"))
 
     def _generate_readme(self, output_path: Path, config: ProjectConfig) -> None:
         """Generate README.md."""
@@ -588,8 +604,7 @@ python spawn_services.py --project-name {config.project_name} --config-path ~/.s
 ```
 """
 
-        with open(output_path / "README.md", "w") as f:
-            f.write(readme_content)
+        (output_path / "README.md").write_bytes(readme_content.encode("utf-8"))
 
     def _generate_deployment_scripts(
         self, output_path: Path, config: ProjectConfig
@@ -634,9 +649,17 @@ fi
 source .venv/bin/activate
 
 # Install/update dependencies{extras_info}
-echo "📥 Installing/updating dependencies..."
-pip install --upgrade pip
-{install_command}
+# Skip the install when pyproject.toml and the install command are unchanged
+DEPS_STAMP=".venv/.deps_stamp"
+DEPS_HASH=$(python -c "import hashlib, sys; print(hashlib.sha256(open('pyproject.toml', 'rb').read() + sys.argv[1].encode()).hexdigest())" "{install_command}")
+if [ -f "$DEPS_STAMP" ] && [ "$(cat "$DEPS_STAMP")" = "$DEPS_HASH" ]; then
+    echo "✅ Dependencies up to date"
+else
+    echo "📥 Installing/updating dependencies..."
+    pip install --upgrade pip
+    {install_command}
+    echo "$DEPS_HASH" > "$DEPS_STAMP"
+fi
 
 # Copy environment file if missing
 if [ ! -f ".env" ]; then
@@ -663,8 +686,7 @@ deactivate
 """
 
         run_script_path = output_path / "run.sh"
-        with open(run_script_path, "w") as f:
-            f.write(run_script_content)
+        run_script_path.write_bytes(run_script_content.encode("utf-8"))
         run_script_path.chmod(0o755)
 
     def _generate_validation_script(
@@ -686,10 +708,26 @@ deactivate
 Tests the generated router to ensure it works correctly.
 \"\"\"
 
+import socket
 import sys
 import time
 import requests
 
+SERVER_HOST = "localhost"
+SERVER_PORT = 8000
+
+def wait_for_server(port=SERVER_PORT, timeout=10.0):
+    \"\"\"Poll the server port until it accepts connections or the timeout expires.\"\"\"
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if s.connect_ex((SERVER_HOST, port)) == 0:
+                return True
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 2, 1.0)
+    return False
+
 def test_router_health():
     \"\"\"Test router health endpoint.\"\"\"
     try:
@@ -749,7 +787,9 @@ def main():
     
     # Wait for server to start
     print("⏳ Waiting for server to start...")
-    time.sleep(5)
+    if not wait_for_server():
+        print(f"❌ Server did not start on port {{SERVER_PORT}}")
+        return 1
     
     # Define test functions
     test_functions = {{
@@ -782,8 +822,9 @@ if __name__ == "__main__":
 """
 
         validation_script_path = output_path / "validate.py"
-        with open(validation_script_path, "w") as f:
-            f.write(validation_script_content)
+        validation_script_path.write_bytes(
+            validation_script_content.encode("utf-8")
+        )
         validation_script_path.chmod(0o755)
 
 
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import cache
 
 PUBLIC_ROUTER_DIR_NAME = "public"
 ROUTER_DIR_NAME = "routers"
@@ -10,8 +11,9 @@ class DelegateControlType(str, Enum):
     UPDATE_PRICING = "update_pricing"
 
     @classmethod
-    def all_types(cls):
-        return [control.value for control in cls]
+    @cache
+    def all_types(cls) -> tuple[str, ...]:
+        return tuple(control.value for control in cls)
 
 
 class PricingChargeType(str, Enum):
@@ -23,8 +25,9 @@ class RouterServiceType(str, Enum):
     SEARCH = "search"
 
     @classmethod
-    def all_types(cls):
-        return [service.value for service in cls]
+    @cache
+    def all_types(cls) -> tuple[str, ...]:
+        return tuple(service.value for service in cls)
 
 
 class RouterType(str, Enum):
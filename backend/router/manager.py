@@ -1,8 +1,9 @@
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import jwt
 from accounting.repository import AccountingRepository
@@ -266,6 +267,7 @@ class RouterManager:
 
         # Fetch published routers from other datasites (requires syftbox client)
         # This involves iterating through datasites and reading metadata.json files
+        metadata_paths = []
         for datasite in self.syftbox_client.datasites.iterdir():
             # Skip current datasite
             if datasite.name == self.syftbox_client.email:
@@ -278,36 +280,50 @@ class RouterManager:
             if not routers_dir.exists():
                 continue
 
-            # Iterate through all the routers in the datasite
+            # Collect the metadata file of every router in the datasite
             for router_dir in routers_dir.iterdir():
-                metadata_path = Path(router_dir) / "metadata.json"
-                if not metadata_path.exists():
-                    continue
-
-                # Load metadata
-                metadata = ProjectMetadata.load_from_file(metadata_path)
-
-                all_routers.append(
-                    RouterOverview(
-                        name=metadata.project_name,
-                        published=True,
-                        author=metadata.author,
-                        summary=metadata.summary,
-                        delegate_email=metadata.delegate_email,
-                        services=[
-                            ServiceOverview(
-                                type=service.type,
-                                pricing=service.pricing,
-                                charge_type=service.charge_type,
-                                enabled=service.enabled,
-                            )
-                            for service in metadata.services
-                        ],
-                    )
+                metadata_paths.append(Path(router_dir) / "metadata.json")
+
+        # Load metadata concurrently, reads on synced datasites are IO bound
+        with ThreadPoolExecutor() as executor:
+            published_metadata = list(
+                executor.map(self._load_published_metadata, metadata_paths)
+            )
+
+        for metadata in published_metadata:
+            if metadata is None:
+                continue
+
+            all_routers.append(
+                RouterOverview(
+                    name=metadata.project_name,
+                    published=True,
+                    author=metadata.author,
+                    summary=metadata.summary,
+                    delegate_email=metadata.delegate_email,
+                    services=[
+                        ServiceOverview(
+                            type=service.type,
+                            pricing=service.pricing,
+                            charge_type=service.charge_type,
+                            enabled=service.enabled,
+                        )
+                        for service in metadata.services
+                    ],
                 )
+            )
 
         return RouterList(routers=all_routers)
 
+    def _load_published_metadata(
+        self, metadata_path: Path
+    ) -> Optional[ProjectMetadata]:
+        """Load published metadata, or None if the router has no metadata file."""
+        try:
+            return ProjectMetadata.load_from_file(metadata_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def delete_router(self, router_name: str, published: bool) -> dict:
         """Delete a router app"""
         router = self.repository.get_router_by_name(router_name)
@@ -374,7 +390,7 @@ class RouterManager:
                 self.router_app_dir / router_name / f"{router_name}.openapi.json"
             )
             if endpoints_dir.exists():
-                endpoints = json.loads(endpoints_dir.read_text())
+                endpoints = json.loads(endpoints_dir.read_bytes())
 
             published = router.published
         elif published:
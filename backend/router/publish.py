@@ -1,9 +1,12 @@
 import hashlib
 import json
+import os
 import shutil
 import tomllib
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import Any, Optional, Union
 
 from rich import print as rprint
@@ -14,6 +17,24 @@ from typer import Abort
 from .constants import PUBLIC_ROUTER_DIR_NAME, ROUTER_DIR_NAME
 from .schemas import ProjectMetadata, ServiceOverview
 
+# Memoized code hashes keyed by project path: (file signature, digest)
+_CODE_HASH_CACHE: dict[str, tuple[list[tuple[str, int, int]], str]] = {}
+
+# Memoized project versions keyed by pyproject path: ((mtime_ns, size), version)
+_PROJECT_VERSION_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+
+# Memoized OpenAPI specs keyed by spec path: ((mtime_ns, size), parsed spec)
+_ENDPOINT_DETAILS_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# Chunk size used when streaming project files into the code hash
+_HASH_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=4)
+def _load_client(client_config_path: str) -> Client:
+    """Load the SyftBox client, reusing it across publish calls for the same config."""
+    return Client.load(client_config_path)
+
 
 class PublishService:
     """Service for publishing projects."""
@@ -21,18 +42,33 @@ class PublishService:
     def __init__(self, client_config_path: Union[str, Path]):
         """Initialize the publish service with client configuration."""
         self.client_config_path = Path(client_config_path)
-        self.client = Client.load(self.client_config_path)
+        self.client = _load_client(str(self.client_config_path))
+        self.public_routers_dir = (
+            self.client.my_datasite / PUBLIC_ROUTER_DIR_NAME / ROUTER_DIR_NAME
+        )
+
+    def _get_published_dir(self, project_name: str) -> Path:
+        """Get the public directory a project is published to."""
+        return self.public_routers_dir / project_name
 
     def _get_project_version(self, project_path: Path) -> str:
         """Extract project version from pyproject.toml."""
         pyproject_path = project_path / "pyproject.toml"
-        if not pyproject_path.exists():
-            return "0.1.0"
 
         try:
             with open(pyproject_path, "rb") as f:
+                # Reuse the parsed version while the file is unchanged
+                file_stat = os.fstat(f.fileno())
+                stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+                cached = _PROJECT_VERSION_CACHE.get(str(pyproject_path))
+                if cached is not None and cached[0] == stat_key:
+                    return cached[1]
                 data = tomllib.load(f)
-            return data.get("project", {}).get("version", "0.1.0")
+            version = data.get("project", {}).get("version", "0.1.0")
+            _PROJECT_VERSION_CACHE[str(pyproject_path)] = (stat_key, version)
+            return version
+        except FileNotFoundError:
+            return "0.1.0"
         except Exception as e:
             rprint(
                 f"[yellow]Warning: Could not read version from pyproject.toml: {e}[/yellow]"
@@ -40,18 +76,49 @@ class PublishService:
             return "0.1.0"
 
     def _calculate_code_hash(self, project_path: Path) -> str:
-        """Calculate SHA256 hash of all Python files in the project."""
-        hash_sha256 = hashlib.sha256()
+        """Calculate SHA256 hash of all Python files in the project.
 
+        Files are streamed into a single SHA256 in path order through one
+        reused buffer, so memory stays constant regardless of project size.
+        The result is memoized per project and reused as long as every file
+        keeps the same path, modification time and size.
+        """
+        signature = []
         for py_file in project_path.rglob("*.py"):
-            if py_file.is_file():
-                try:
-                    with open(py_file, "rb") as f:
-                        hash_sha256.update(f.read())
-                except Exception as e:
-                    rprint(f"[yellow]Warning: Could not read {py_file}: {e}[/yellow]")
+            try:
+                file_stat = py_file.stat()
+            except OSError:
+                continue
+            if S_ISREG(file_stat.st_mode):
+                signature.append(
+                    (str(py_file), file_stat.st_mtime_ns, file_stat.st_size)
+                )
+
+        signature.sort()
+
+        cache_key = str(project_path.resolve())
+        cached = _CODE_HASH_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-        return hash_sha256.hexdigest()
+        hash_sha256 = hashlib.sha256()
+        buffer = bytearray(_HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        complete = True
+
+        for py_file, _, _ in signature:
+            try:
+                with open(py_file, "rb", buffering=0) as f:
+                    while n := f.readinto(buffer):
+                        hash_sha256.update(view[:n])
+            except Exception as e:
+                complete = False
+                rprint(f"[yellow]Warning: Could not read {py_file}: {e}[/yellow]")
+
+        code_hash = hash_sha256.hexdigest()
+        if complete:
+            _CODE_HASH_CACHE[cache_key] = (signature, code_hash)
+        return code_hash
 
     def _get_schema_path(self, apps_data_dir: Path) -> Optional[str]:
         """Get the path to the RPC schema file."""
@@ -73,10 +140,24 @@ class PublishService:
     def _get_endpoint_details(
         self, project_name: str, project_path: Path
     ) -> dict[str, Any]:
-        """Get the endpoint details for the project."""
-        with open(project_path / f"{project_name}.openapi.json", "r") as f:
-            data = json.load(f)
-        return data
+        """Get the endpoint details for the project.
+
+        The parsed spec is cached and the same dict is returned on every hit,
+        so callers must treat it as read-only.
+        """
+        spec_path = project_path / f"{project_name}.openapi.json"
+
+        # Reuse the parsed spec while the file is unchanged
+        file_stat = spec_path.stat()
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _ENDPOINT_DETAILS_CACHE.get(str(spec_path))
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+
+        # Parse straight from bytes to skip the text-mode decode layer
+        endpoint_details = json.loads(spec_path.read_bytes())
+        _ENDPOINT_DETAILS_CACHE[str(spec_path)] = (stat_key, endpoint_details)
+        return endpoint_details
 
     def publish(
         self,
@@ -103,10 +184,13 @@ class PublishService:
         """
         project_path = Path(project_folder_path)
 
-        if not project_path.exists():
+        # One stat answers both the existence and the directory check
+        try:
+            project_stat = project_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise Abort(f"Project folder does not exist: {project_path}")
 
-        if not project_path.is_dir():
+        if not S_ISDIR(project_stat.st_mode):
             raise Abort(f"Project path is not a directory: {project_path}")
 
         # Get client directories
@@ -136,17 +220,14 @@ class PublishService:
         # Make RPC endpoints public i.e. visible to all users
         self._set_rpc_endpoints_visibility(apps_data_dir, make_private=False)
 
-        # Write metadata.json
-        metadata_path = (
-            self.client.my_datasite
-            / PUBLIC_ROUTER_DIR_NAME
-            / ROUTER_DIR_NAME
-            / project_name
-            / "metadata.json"
-        )
+        # Write metadata.json, only creating the directory when it is missing
+        metadata_path = self._get_published_dir(project_name) / "metadata.json"
 
-        metadata_path.parent.mkdir(parents=True, exist_ok=True)
-        metadata.save_to_file(metadata_path)
+        try:
+            metadata.save_to_file(metadata_path)
+        except FileNotFoundError:
+            metadata_path.parent.mkdir(parents=True, exist_ok=True)
+            metadata.save_to_file(metadata_path)
 
         return metadata, metadata_path
 
@@ -155,23 +236,12 @@ class PublishService:
 
         This function will unpublish a project by deleting the metadata.json file.
         """
-        metadata_path = (
-            self.client.my_datasite
-            / PUBLIC_ROUTER_DIR_NAME
-            / ROUTER_DIR_NAME
-            / project_name
-            / "metadata.json"
-        )
+        project_path = self._get_published_dir(project_name)
 
+        metadata_path = project_path / "metadata.json"
         metadata_path.unlink(missing_ok=True)
 
         # Delete the project folder
-        project_path = (
-            self.client.my_datasite
-            / PUBLIC_ROUTER_DIR_NAME
-            / ROUTER_DIR_NAME
-            / project_name
-        )
         shutil.rmtree(project_path, ignore_errors=True)
 
         # Make RPC endpoints private i.e. only visible to the owner
@@ -1,10 +1,12 @@
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 import jwt
-from pydantic import BaseModel, EmailStr, Field, model_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 from .constants import (
     DelegateControlType,
@@ -91,6 +93,12 @@ class PublishRouterRequest(BaseModel):
     tags: list[str]
     services: list[ServiceOverview]
 
+    @field_validator("tags")
+    @classmethod
+    def validate_tags(cls, v: list[str]) -> list[str]:
+        # Strip whitespace and drop empty tags in a single pass
+        return [tag for tag in map(str.strip, v) if tag]
+
 
 class CreateRouterRequest(BaseModel):
     name: str
@@ -164,11 +172,31 @@ class ProjectMetadata(BaseModel):
     @classmethod
     def load_from_file(cls, file_path: Path) -> "ProjectMetadata":
         """Load project metadata from a file."""
-        return cls.model_validate_json(file_path.read_text())
+        return cls.model_validate_json(file_path.read_bytes())
 
     def save_to_file(self, file_path: Path) -> None:
-        """Save project metadata to a file."""
-        file_path.write_text(self.model_dump_json())
+        """Save project metadata to a file.
+
+        The JSON is written to a temporary file and renamed into place, so
+        readers never see a partially written metadata file.
+        """
+        # A unique temp file per save, so concurrent writers never share one
+        fd, tmp_name = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.model_dump_json().encode("utf-8"))
+            # mkstemp creates the file owner-only; keep metadata world-readable
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            # Don't leave temp files behind in the synced datasite directory
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
 
 
 class RouterServiceStatus(BaseModel):